@@ -35,6 +35,8 @@ from torchtnt.framework._test_utils import (
 )
 
 from torchtnt.framework.auto_unit import (
+    _get_default_precision,
+    _maybe_enable_fused_optimizer,
     AutoPredictUnit,
     AutoUnit,
     SWALRParams,
@@ -203,6 +205,76 @@ class TestAutoUnit(unittest.TestCase):
                 precision="foo",
             )
 
+    def test_default_precision(self) -> None:
+        """
+        Test that precision defaults to bf16 only on bf16-capable GPUs
+        """
+        with patch("torch.cuda.is_bf16_supported", return_value=True):
+            self.assertEqual(
+                _get_default_precision(torch.device("cuda")), torch.bfloat16
+            )
+        with patch("torch.cuda.is_bf16_supported", return_value=False):
+            self.assertIsNone(_get_default_precision(torch.device("cuda")))
+        self.assertIsNone(_get_default_precision(torch.device("cpu")))
+
+    def test_mixed_precision_fp32_opt_out(self) -> None:
+        """
+        Test that passing fp32 disables mixed precision and the grad scaler
+        """
+        my_module = torch.nn.Linear(2, 2)
+        auto_unit = DummyAutoUnit(
+            module=my_module,
+            precision="fp32",
+        )
+        self.assertIsNone(auto_unit.precision)
+        self.assertIsNone(auto_unit.grad_scaler)
+
+    def test_maybe_enable_fused_optimizer(self) -> None:
+        """
+        Test that the fused optimizer switch respects the opt-out paths
+        """
+        module = torch.nn.Linear(2, 2)
+
+        # non-Adam optimizers are left untouched
+        sgd = torch.optim.SGD(module.parameters(), lr=0.1)
+        _maybe_enable_fused_optimizer(sgd)
+        self.assertIsNot(sgd.defaults.get("fused"), True)
+
+        # an explicit implementation choice is respected
+        adam = torch.optim.Adam(module.parameters(), foreach=True)
+        _maybe_enable_fused_optimizer(adam)
+        self.assertIsNone(adam.defaults["fused"])
+
+        # differentiable updates are incompatible with the fused kernel
+        adam = torch.optim.Adam(module.parameters(), differentiable=True)
+        _maybe_enable_fused_optimizer(adam)
+        self.assertIsNone(adam.defaults["fused"])
+
+        # subclasses of Adam are never mutated
+        class MyAdam(torch.optim.Adam):
+            pass
+
+        my_adam = MyAdam(module.parameters())
+        _maybe_enable_fused_optimizer(my_adam)
+        self.assertIsNone(my_adam.defaults["fused"])
+
+        # cpu parameters are not eligible for the fused CUDA implementation
+        adam = torch.optim.Adam(module.parameters())
+        _maybe_enable_fused_optimizer(adam)
+        self.assertIsNone(adam.defaults["fused"])
+
+    @skip_if_not_gpu
+    def test_maybe_enable_fused_optimizer_on_gpu(self) -> None:
+        """
+        Test that eligible Adam optimizers are switched to the fused implementation
+        """
+        module = torch.nn.Linear(2, 2, device="cuda")
+        adam = torch.optim.Adam(module.parameters())
+        _maybe_enable_fused_optimizer(adam)
+        self.assertTrue(adam.defaults["fused"])
+        for param_group in adam.param_groups:
+            self.assertTrue(param_group["fused"])
+
     def test_predict_step(self) -> None:
         """
         Test predict step functionality
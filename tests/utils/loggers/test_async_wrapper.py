@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+import unittest
+
+import torch
+from torchtnt.utils.loggers.async_wrapper import AsyncLogger
+from torchtnt.utils.loggers.in_memory import InMemoryLogger
+
+
+class AsyncLoggerTest(unittest.TestCase):
+    def test_async_log(self) -> None:
+        destination = InMemoryLogger()
+        logger = AsyncLogger(destination)
+        logger.log(name="metric1", data=123.0, step=0)
+        logger.log_dict(payload={"metric2": 1.0, "metric3": 2.0}, step=1)
+        # flush acts as a barrier for pending writes
+        logger.flush()
+        buf = destination.log_buffer
+        self.assertEqual(buf[0]["metric1"], 123.0)
+        self.assertEqual(buf[1]["metric2"], 1.0)
+        self.assertEqual(buf[1]["metric3"], 2.0)
+        logger.close()
+
+    def test_async_log_tensor_detached(self) -> None:
+        destination = InMemoryLogger()
+        logger = AsyncLogger(destination)
+        data = torch.tensor(5.0, requires_grad=True)
+        logger.log(name="metric1", data=data, step=0)
+        logger.flush()
+        self.assertEqual(destination.log_buffer[0]["metric1"], 5.0)
+        logger.close()
+
+    def test_async_log_write_failure_is_surfaced(self) -> None:
+        class FailingLogger(InMemoryLogger):
+            def log(self, name, data, step) -> None:  # pyre-fixme[2]
+                raise ValueError("disk full")
+
+        logger = AsyncLogger(FailingLogger())
+        with self.assertLogs(
+            "torchtnt.utils.loggers.async_wrapper", level="ERROR"
+        ) as log_watcher:
+            logger.log(name="metric1", data=1.0, step=0)
+            # flush waits for the write (and its done-callback) to complete
+            logger.flush()
+        self.assertIn("AsyncLogger write failed", log_watcher.output[0])
+        self.assertIn("disk full", log_watcher.output[0])
+
+    def test_log_after_close_raises(self) -> None:
+        logger = AsyncLogger(InMemoryLogger())
+        logger.close()
+        with self.assertRaisesRegex(
+            RuntimeError, "Cannot log after the AsyncLogger has been closed."
+        ):
+            logger.log(name="metric1", data=1.0, step=0)
@@ -20,6 +20,7 @@ from torchtnt.utils.device import (
     get_device_from_env,
     get_nvidia_smi_gpu_stats,
     get_psutil_cpu_stats,
+    pin_data,
     record_data_in_stream,
     set_float32_precision,
 )
@@ -239,6 +240,21 @@ class DeviceTest(unittest.TestCase):
             elif isinstance(val, str):
                 self.assertEqual(val, "string")
 
+    @skip_if_not_gpu
+    def test_pin_data(self) -> None:
+        a = torch.tensor([1, 2, 3])
+        b = torch.tensor([4, 5, 6])
+        self.assertFalse(a.is_pinned())
+        self.assertFalse(b.is_pinned())
+
+        nested_data = {"1": [a, (b, 2.0)], "2": "string"}
+        pinned_data = pin_data(nested_data)
+        self.assertTrue(pinned_data["1"][0].is_pinned())
+        self.assertTrue(pinned_data["1"][1][0].is_pinned())
+        # check that float and string are unchanged
+        self.assertEqual(pinned_data["1"][1][1], 2.0)
+        self.assertEqual(pinned_data["2"], "string")
+
     def test_get_cpu_stats(self) -> None:
         """Get CPU stats, check that values are populated."""
         cpu_stats = get_psutil_cpu_stats()
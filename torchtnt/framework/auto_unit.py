@@ -9,18 +9,31 @@ import contextlib
 from abc import ABCMeta, abstractmethod
 from copy import deepcopy
 from dataclasses import dataclass
-from typing import Any, Generic, Iterator, List, Optional, Tuple, TypeVar, Union
+from typing import (
+    Any,
+    ContextManager,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import torch
 from pyre_extensions import none_throws
-from torch.distributed.fsdp import FullyShardedDataParallel as FSDP
 from torch.nn.parallel import DistributedDataParallel as DDP
 from torch.optim.swa_utils import SWALR
 from torchtnt.framework._loop_utils import _step_requires_iterator
 from torchtnt.framework.state import ActivePhase, EntryPoint, State
 from torchtnt.framework.unit import EvalUnit, PredictUnit, TPredictData, TrainUnit
 from torchtnt.framework.utils import get_timing_context
-from torchtnt.utils.device import copy_data_to_device, record_data_in_stream
+from torchtnt.utils.device import (
+    copy_data_to_device,
+    record_data_in_stream,
+    set_float32_precision,
+)
 from torchtnt.utils.env import init_from_env
 from torchtnt.utils.lr_scheduler import TLRScheduler
 from torchtnt.utils.precision import (
@@ -36,6 +49,7 @@ from torchtnt.utils.prepare_module import (
     Strategy,
     TorchCompileParams,
 )
+from torchtnt.utils.rank_zero_log import rank_zero_info, rank_zero_warn
 from torchtnt.utils.swa import AveragedModel
 from torchtnt.utils.version import is_torch_version_ge_1_13_1
 from typing_extensions import Literal
@@ -43,6 +57,11 @@ from typing_extensions import Literal
 
 TData = TypeVar("TData")
 
+# reusable no-op context manager, to avoid constructing a fresh nullcontext on
+# every step. nullcontext holds no per-enter state, so a single instance can be
+# reentered freely.
+_NULL_CONTEXT: ContextManager = contextlib.nullcontext()
+
 
 @dataclass
 class SWALRParams:
@@ -125,6 +144,8 @@ class _ConfigureOptimizersCaller(ABCMeta):
             x.optimizer, x.lr_scheduler = x.configure_optimizers_and_lr_scheduler(
                 x.module
             )
+            if x.device.type == "cuda":
+                _maybe_enable_fused_optimizer(x.optimizer)
 
             if x.swa_params and x.swa_params.swalr_params:
                 swalr_params = x.swa_params.swalr_params
@@ -141,6 +162,14 @@ class _ConfigureOptimizersCaller(ABCMeta):
 class _AutoUnitMixin(Generic[TData]):
     """
     A mixin to share initialization of shared attributes and introduce prefetching.
+
+    Batches are double-buffered: while the current batch runs forward/backward on
+    the compute stream, the next batch is fetched from the iterator and copied to
+    the device with ``non_blocking=True`` on a dedicated CUDA stream. Before a
+    batch is handed to the step, the compute stream waits on the copy stream and
+    the batch memory is recorded on it, so the host-to-device transfer overlaps
+    the previous step's compute. On CPU the copy stream is ``None`` and the same
+    code path degrades to a plain synchronous copy.
     """
 
     def __init__(
@@ -163,13 +192,28 @@ class _AutoUnitMixin(Generic[TData]):
             else precision
         )
 
+        if self.device.type == "cpu" and self.precision == torch.float16:
+            # CPU autocast historically only supports bfloat16; fp16 either raises or
+            # falls back to slow emulated kernels depending on the torch version
+            rank_zero_warn(
+                "fp16 autocast is not well supported on CPU and may raise or run slowly. "
+                'Use precision="bf16" for CPU mixed precision training.'
+            )
+
         self.detect_anomaly = detect_anomaly
 
-        # create autocast context based on precision and device type
-        self.maybe_autocast_precision = torch.autocast(
-            device_type=self.device.type,
-            dtype=self.precision,
-            enabled=self.precision is not None,
+        # create autocast context based on precision and device type. when no
+        # precision is set, use a null context instead of a disabled autocast
+        # context, since even a disabled torch.autocast has non-trivial
+        # per-step enter/exit overhead
+        self.maybe_autocast_precision: ContextManager = (
+            torch.autocast(
+                device_type=self.device.type,
+                dtype=self.precision,
+                enabled=True,
+            )
+            if self.precision is not None
+            else contextlib.nullcontext()
         )
 
         # cuda stream to use for moving data to device
@@ -208,6 +252,21 @@ class _AutoUnitMixin(Generic[TData]):
 
         Returns:
             A batch of data which is on the device
+
+        Note:
+            :py:func:`~torchtnt.utils.copy_data_to_device` forwards extra keyword arguments to ``Tensor.to``, so overriding this method
+            is the recommended hook for data layout conversions, e.g. ``torch.channels_last`` for CNN workloads::
+
+                def move_data_to_device(self, state, data, non_blocking):
+                    return copy_data_to_device(
+                        data,
+                        self.device,
+                        non_blocking=non_blocking,
+                        memory_format=torch.channels_last,
+                    )
+
+            Converting the batch once at transfer time lets cuDNN pick channels-last kernels without reformatting inside the model.
+            Convert the module's weights once up front (``module.to(memory_format=torch.channels_last)``) before passing it in.
         """
         return copy_data_to_device(data, self.device, non_blocking=non_blocking)
 
@@ -325,7 +384,7 @@ class AutoPredictUnit(_AutoUnitMixin[TPredictData], PredictUnit[TPredictData]):
         maybe_detect_anomaly = (
             torch.autograd.set_detect_anomaly(detect_anomaly)
             if detect_anomaly is not None
-            else contextlib.nullcontext()
+            else _NULL_CONTEXT
         )
 
         with self.maybe_autocast_precision, maybe_detect_anomaly:
@@ -407,7 +466,8 @@ class AutoUnit(
         device: the device to be used.
         strategy: the data parallelization strategy to be used. if a string, must be one of ``ddp`` or ``fsdp``.
         step_lr_interval: whether to step lr_scheduler every step or every epoch. Defaults to every epoch.
-        precision: the precision to use in training/evaluation, as either a string or a torch.dtype.
+        precision: the precision to use in training/evaluation, as either a string or a torch.dtype. If not set and the GPU supports
+            bfloat16, bf16 will be used. Pass ``"fp32"`` to disable mixed precision.
         gradient_accumulation_steps: how many batches to accumulate gradients over.
         detect_anomaly: whether to enable anomaly detection for the autograd engine https://pytorch.org/docs/stable/autograd.html#anomaly-detection
         clip_grad_norm: max norm of the gradients for clipping https://pytorch.org/docs/stable/generated/torch.nn.utils.clip_grad_norm_.html
@@ -416,13 +476,30 @@ class AutoUnit(
         torch_compile_params: params for Torch compile https://pytorch.org/docs/stable/generated/torch.compile.html
         activation_checkpoint_params: params for enabling activation checkpointing
         training: if True, the optimizer and optionally LR scheduler will be created after the class is initialized.
+        enable_tf32: if True and running on CUDA, allows TF32 for float32 matrix multiplications and convolutions.
+        cudnn_benchmark: if True and running on CUDA, enables cuDNN algorithm autotuning. Disable when input shapes vary between steps.
 
     Note:
         If :class:`~torchtnt.utils.prepare_module.FSDPStrategy` and SWAParams are passed in, the swa model will be sharded with the same FSDP parameters.
 
+    Note:
+        When training with :class:`~torchtnt.utils.prepare_module.FSDPStrategy`, prefer configuring mixed precision through the strategy's
+        ``mixed_precision`` policy rather than through ``precision``. FSDP then shards and reduces directly in low precision, and the
+        autocast context is skipped to avoid redundant per-op casts. ``precision`` is still used to decide whether a grad scaler is needed.
+
     Note:
         Torch compile support is only available in PyTorch 2.0 or higher.
 
+    Note:
+        For small models whose step time is dominated by kernel launch overhead, pass
+        ``TorchCompileParams(mode="reduce-overhead")`` to capture the compiled regions into
+        CUDA Graphs, which replays the step's kernels with a single launch.
+
+    Note:
+        A ``torch.jit.ScriptModule`` (from ``torch.jit.script`` or ``torch.jit.trace``) may be passed as ``module`` to run a JIT'd
+        forward pass; ``compute_loss`` invokes it through ``self.module`` unchanged. On PyTorch 2.0 or higher, prefer
+        ``torch_compile_params``, which also optimizes the backward pass.
+
     """
 
     def __init__(
@@ -441,7 +518,14 @@ class AutoUnit(
         torch_compile_params: Optional[TorchCompileParams] = None,
         activation_checkpoint_params: Optional[ActivationCheckpointParams] = None,
         training: bool = True,
+        enable_tf32: bool = True,
+        cudnn_benchmark: bool = True,
     ) -> None:
+        device = device or init_from_env()
+        if precision is None:
+            # only default training to bf16; AutoPredictUnit keeps the fp32 default
+            # so prediction outputs don't change unless mixed precision is requested
+            precision = _get_default_precision(device)
         super().__init__(
             module=module,
             device=device,
@@ -450,6 +534,14 @@ class AutoUnit(
             torch_compile_params=torch_compile_params,
         )
 
+        if self.device.type == "cuda":
+            if enable_tf32:
+                # allow TF32 for float32 matmuls and convolutions; on Ampere+ this is a
+                # large throughput win with negligible accuracy impact
+                set_float32_precision("high")
+            if cudnn_benchmark:
+                torch.backends.cudnn.benchmark = True
+
         if not gradient_accumulation_steps > 0:
             raise ValueError(
                 f"gradient_accumulation_steps must be > 0. Got {gradient_accumulation_steps}"
@@ -485,6 +577,26 @@ class AutoUnit(
             activation_checkpoint_params=activation_checkpoint_params,
         )
 
+        if (
+            isinstance(strategy, FSDPStrategy)
+            and strategy.mixed_precision is not None
+            and self.precision is not None
+        ):
+            # FSDP's MixedPrecision policy casts parameters, buffers, and reduction
+            # to the configured dtypes natively, which avoids the per-op up/down
+            # casts autocast inserts. Don't stack autocast on top of it.
+            rank_zero_info(
+                "Disabling autocast since the FSDPStrategy was configured with a MixedPrecision policy, "
+                "which handles low precision natively."
+            )
+            self.maybe_autocast_precision = _NULL_CONTEXT
+
+        # precompute whether the module is wrapped for data parallelism, since this is
+        # checked on every train step and is constant over training
+        self._is_parallel_module: bool = isinstance(self.module, DDP) or _is_fsdp_module(
+            self.module
+        )
+
         self.grad_scaler: Optional[torch.amp.GradScaler] = None
         if self.precision:
             self.grad_scaler = get_grad_scaler_from_precision(
@@ -499,8 +611,6 @@ class AutoUnit(
         self.clip_grad_norm = clip_grad_norm
         self.clip_grad_value = clip_grad_value
 
-        # create autocast context based on precision and device type
-
         self.training = training
 
         self.optimizer: Optional[torch.optim.Optimizer] = None
@@ -543,8 +653,10 @@ class AutoUnit(
 
     # pyre-fixme[3]: Return annotation cannot contain `Any`.
     def train_step(self, state: State, data: TData) -> Tuple[torch.Tensor, Any]:
+        # cache progress once to avoid repeated chained attribute lookups in the hot path
+        train_progress = self.train_progress
         should_update_weights = (
-            self.train_progress.num_steps_completed_in_epoch + 1
+            train_progress.num_steps_completed_in_epoch + 1
         ) % self.gradient_accumulation_steps == 0 or self._is_last_batch
 
         # for pyre, assign to local variable
@@ -556,9 +668,8 @@ class AutoUnit(
         # https://pytorch.org/docs/stable/fsdp.html#torch.distributed.fsdp.FullyShardedDataParallel.no_sync
         maybe_no_sync = (
             module.no_sync()
-            if not should_update_weights
-            and (isinstance(module, DDP) or _is_fsdp_module(module))
-            else contextlib.nullcontext()
+            if not should_update_weights and self._is_parallel_module
+            else _NULL_CONTEXT
         )
 
         # if detect_anomaly is true, run forward and backward pass in detect_anomaly context
@@ -566,7 +677,7 @@ class AutoUnit(
         maybe_detect_anomaly = (
             torch.autograd.set_detect_anomaly(detect_anomaly)
             if detect_anomaly is not None
-            else contextlib.nullcontext()
+            else _NULL_CONTEXT
         )
 
         grad_scaler = self.grad_scaler
@@ -578,22 +689,22 @@ class AutoUnit(
                     # Run the forward pass and compute the loss
                     loss, outputs = self.compute_loss(state, data)
 
-            # normalize loss to account for gradient accumulation
-            loss = loss / self.gradient_accumulation_steps
+            # normalize loss to account for gradient accumulation. skip the division
+            # when accumulation is off to avoid an unnecessary kernel launch per step
+            if self.gradient_accumulation_steps > 1:
+                loss = loss / self.gradient_accumulation_steps
 
-            if grad_scaler:
-                scaled_loss = grad_scaler.scale(loss)
-                with get_timing_context(state, f"{self.__class__.__name__}.backward"):
-                    scaled_loss.backward()
-            else:
-                with get_timing_context(state, f"{self.__class__.__name__}.backward"):
+            with get_timing_context(state, f"{self.__class__.__name__}.backward"):
+                if grad_scaler:
+                    grad_scaler.scale(loss).backward()
+                else:
                     loss.backward()
 
         total_grad_norm = None
         if should_update_weights:
             total_grad_norm = self._update_weights(state)
 
-        step = self.train_progress.num_steps_completed
+        step = train_progress.num_steps_completed
         results = TrainStepResults(loss, total_grad_norm, outputs)
         self.on_train_step_end(state, data, step, results)
         return loss, outputs
@@ -702,6 +813,10 @@ class AutoUnit(
         """
         Updates weights of the module, handles clip gradient norm, etc.
 
+        When a grad scaler is active and clipping is requested, gradients are unscaled
+        in-place exactly once before clipping; ``grad_scaler.step`` detects this and will
+        not unscale a second time.
+
         Returns total norm of the parameter gradients, if gradient norm clipping is enabled.
         """
         module = self.module
@@ -719,6 +834,11 @@ class AutoUnit(
         # gradient norm clipping
         if clip_grad_norm:
             if _is_fsdp_module(module):
+                # FSDP is only needed for this isinstance check, so keep the import
+                # local to this branch. note this does not avoid the import cost at
+                # module load: prepare_module still imports FSDP at module scope
+                from torch.distributed.fsdp import FullyShardedDataParallel as FSDP
+
                 if isinstance(module, FSDP):
                     with get_timing_context(
                         state, f"{self.__class__.__name__}.clip_grad_norm"
@@ -840,6 +960,63 @@ class AutoUnit(
                     lr_scheduler.step()
 
 
+def _get_default_precision(device: torch.device) -> Optional[torch.dtype]:
+    """
+    Returns the precision to use when none was requested: bf16 on a bf16-capable
+    GPU, since bf16 autocast doubles tensor core throughput and needs no grad
+    scaling, otherwise ``None`` (full fp32).
+    """
+    if device.type == "cuda" and torch.cuda.is_bf16_supported():
+        rank_zero_info(
+            "No precision was passed and the GPU supports bfloat16: defaulting to bf16 mixed precision. "
+            'Pass precision="fp32" to disable mixed precision.'
+        )
+        return torch.bfloat16
+    return None
+
+
+def _maybe_enable_fused_optimizer(optimizer: torch.optim.Optimizer) -> None:
+    """
+    Switches Adam/AdamW optimizers to their fused CUDA implementation when the user
+    has not chosen an implementation explicitly. The fused implementation performs the
+    update for all parameters with a single kernel instead of one kernel launch per
+    parameter tensor.
+    """
+    # exact type check so subclasses with custom step logic are never mutated
+    if type(optimizer) not in (torch.optim.Adam, torch.optim.AdamW):
+        return
+
+    defaults = optimizer.defaults
+    # respect an explicit user choice of implementation
+    if (
+        "fused" not in defaults
+        or defaults.get("fused") is not None
+        or defaults.get("foreach") is not None
+    ):
+        return
+
+    # the fused kernel is incompatible with differentiable and capturable updates,
+    # which the optimizer constructor would otherwise have rejected alongside fused
+    if defaults.get("differentiable") or defaults.get("capturable"):
+        return
+
+    # the fused implementation requires all parameters to be floating point CUDA tensors
+    if not all(
+        param.is_cuda and torch.is_floating_point(param)
+        for param_group in optimizer.param_groups
+        for param in param_group["params"]
+    ):
+        return
+
+    defaults["fused"] = True
+    for param_group in optimizer.param_groups:
+        param_group["fused"] = True
+    rank_zero_info(
+        f"Enabled the fused implementation of {type(optimizer).__name__}. "
+        "Pass fused=False to the optimizer to opt out."
+    )
+
+
 def _validate_torch_compile_available() -> None:
     if not is_torch_version_ge_1_13_1():
         raise RuntimeError(
@@ -11,6 +11,7 @@ from .device import (
     get_nvidia_smi_gpu_stats,
     get_psutil_cpu_stats,
     GPUStats,
+    pin_data,
     record_data_in_stream,
     set_float32_precision,
 )
@@ -91,6 +92,7 @@ __all__ = [
     "get_nvidia_smi_gpu_stats",
     "get_psutil_cpu_stats",
     "GPUStats",
+    "pin_data",
     "set_float32_precision",
     "record_data_in_stream",
     "all_gather_tensors",
@@ -126,6 +126,60 @@ def copy_data_to_device(data: T, device: torch.device, *args: Any, **kwargs: Any
     return data
 
 
+@runtime_checkable
+class _PinnableData(Protocol):
+    def pin_memory(self: TSelf) -> TSelf:
+        """Copy data into page-locked (pinned) host memory"""
+        ...
+
+
+def pin_data(data: T) -> T:
+    """Function that recursively copies host data into page-locked (pinned) memory.
+
+    Host tensors must live in pinned memory for host-to-device copies with
+    ``non_blocking=True`` to be truly asynchronous, allowing the transfer to
+    overlap with compute already enqueued on the device.
+
+    Args:
+        data: The data to pin
+
+    Returns:
+        The data in pinned memory
+    """
+
+    # Redundant isinstance(data, tuple) check is required here to make pyre happy
+    if _is_named_tuple(data) and isinstance(data, tuple):
+        return type(data)(**pin_data(data._asdict()))
+    elif isinstance(data, (list, tuple)):
+        return type(data)(pin_data(e) for e in data)
+    elif isinstance(data, defaultdict):
+        return type(data)(
+            data.default_factory,
+            {k: pin_data(v) for k, v in data.items()},
+        )
+    elif isinstance(data, Mapping):
+        return type(data)({k: pin_data(v) for k, v in data.items()})
+    elif is_dataclass(data) and not isinstance(data, type):
+        new_data_class = type(data)(
+            **{
+                field.name: pin_data(getattr(data, field.name))
+                for field in fields(data)
+                if field.init
+            }
+        )
+        for field in fields(data):
+            if not field.init:
+                setattr(
+                    new_data_class,
+                    field.name,
+                    pin_data(getattr(data, field.name)),
+                )
+        return new_data_class
+    elif isinstance(data, _PinnableData):
+        return data.pin_memory()
+    return data
+
+
 def record_data_in_stream(data: T, stream: torch.cuda.streams.Stream) -> None:
     """
     Records the tensor element on certain streams, to avoid memory from being reused for another tensor.
@@ -4,6 +4,7 @@
 # This source code is licensed under the BSD-style license found in the
 # LICENSE file in the root directory of this source tree.
 
+from .async_wrapper import AsyncLogger
 from .csv import CSVLogger
 from .file import FileLogger
 from .in_memory import InMemoryLogger
@@ -15,6 +16,7 @@ from .utils import scalar_to_float
 
 
 __all__ = [
+    "AsyncLogger",
     "CSVLogger",
     "FileLogger",
     "InMemoryLogger",
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+import atexit
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Mapping, Optional
+
+import torch
+
+from torchtnt.utils.loggers.logger import MetricLogger, Scalar
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+# pyre-fixme[24]: Generic type `Future` expects 1 type parameter.
+def _log_write_failure(future: Future) -> None:
+    """Surfaces exceptions raised by the destination logger on the worker thread."""
+    exception = future.exception()
+    if exception is not None:
+        logger.error("AsyncLogger write failed", exc_info=exception)
+
+
+class AsyncLogger(MetricLogger):
+    """
+    Wrapper that moves the writes of another :class:`~torchtnt.utils.loggers.logger.MetricLogger`
+    off the critical path.
+
+    Logger backends often perform filesystem or network writes and CPU-side
+    aggregations which would otherwise block the training step. Calls to
+    ``log``/``log_dict`` are submitted to a single background thread and
+    executed in order; ``flush`` and ``close`` wait for pending writes to
+    drain first.
+
+    Tensor data is detached and copied to CPU before being enqueued, so no
+    live GPU tensor is captured by the background thread.
+
+    Example:
+            from torchtnt.utils.loggers import AsyncLogger, CSVLogger
+            logger = AsyncLogger(CSVLogger("metrics.csv"))
+            logger.log("accuracy", 23.56, 10)
+            logger.close()
+
+    Args:
+        destination: the logger to which writes are forwarded.
+    """
+
+    def __init__(self, destination: MetricLogger) -> None:
+        self._destination = destination
+        self._executor: Optional[ThreadPoolExecutor] = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="AsyncLogger"
+        )
+        atexit.register(self.close)
+
+    def _submit(self, fn, *args) -> None:  # pyre-fixme[2]: Parameter must be annotated.
+        executor = self._executor
+        if executor is None:
+            raise RuntimeError("Cannot log after the AsyncLogger has been closed.")
+        executor.submit(fn, *args).add_done_callback(_log_write_failure)
+
+    @staticmethod
+    def _to_cpu(data: Scalar) -> Scalar:
+        if isinstance(data, torch.Tensor):
+            return data.detach().cpu()
+        return data
+
+    def log(self, name: str, data: Scalar, step: int) -> None:
+        """Log scalar data on the background thread.
+
+        Args:
+            name (string): tag name used to group scalars
+            data (float/int/Tensor): scalar data to log
+            step (int): step value to record
+        """
+
+        self._submit(self._destination.log, name, self._to_cpu(data), step)
+
+    def log_dict(self, payload: Mapping[str, Scalar], step: int) -> None:
+        """Log multiple scalar values on the background thread.
+
+        Args:
+            payload (dict): dictionary of tag name and scalar value
+            step (int): step value to record
+        """
+
+        payload = {k: self._to_cpu(v) for k, v in payload.items()}
+        self._submit(self._destination.log_dict, payload, step)
+
+    def flush(self) -> None:
+        """Wait for pending writes to drain, then flush the wrapped logger if it supports flushing."""
+
+        executor = self._executor
+        if executor is None:
+            return
+        destination_flush = getattr(self._destination, "flush", None)
+        # submitting and waiting on the result acts as a barrier for pending writes
+        executor.submit(destination_flush if destination_flush else lambda: None).result()
+
+    def close(self) -> None:
+        """Drain pending writes and close the wrapped logger.
+
+        Logs should not be written after `close` is called.
+        """
+
+        executor = self._executor
+        if executor is None:
+            return
+        # drain pending writes, then close the destination on the calling thread.
+        # close must not be submitted to the executor: when invoked via atexit the
+        # executor has already been shut down by concurrent.futures' own exit hook
+        # (which runs before atexit callbacks), so submit would raise. shutdown is
+        # idempotent, and the direct call is still ordered after all drained writes.
+        executor.shutdown(wait=True)
+        self._executor = None
+        self._destination.close()
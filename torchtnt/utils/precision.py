@@ -5,7 +5,7 @@
 # This source code is licensed under the BSD-style license found in the
 # LICENSE file in the root directory of this source tree.
 
-from typing import Mapping, Optional
+from typing import Callable, Mapping, Optional, Tuple
 
 import torch
 from torch.cuda.amp.grad_scaler import GradScaler
@@ -29,11 +29,32 @@ def convert_precision_str_to_dtype(precision: str) -> Optional[torch.dtype]:
         ValueError if an invalid precision string is passed.
 
     """
-    if precision not in _DTYPE_STRING_TO_DTYPE_MAPPING:
+    try:
+        return _DTYPE_STRING_TO_DTYPE_MAPPING[precision]
+    except KeyError:
         raise ValueError(
             f"Precision {precision} not supported. Please use one of {list(_DTYPE_STRING_TO_DTYPE_MAPPING.keys())}"
-        )
-    return _DTYPE_STRING_TO_DTYPE_MAPPING[precision]
+        ) from None
+
+
+def _sharded_grad_scaler_factory() -> torch.amp.GradScaler:
+    # ShardedGradScaler is only needed for fp16 FSDP training, so keep the import
+    # local to this factory (FSDP itself is already imported transitively through
+    # prepare_module's _is_fsdp_module)
+    from torch.distributed.fsdp.sharded_grad_scaler import ShardedGradScaler
+
+    return ShardedGradScaler()
+
+
+# dispatch table keyed by (precision, is_fsdp). dtypes that need no grad scaling
+# (e.g. bf16) are simply absent; new low-precision scalers can be added here
+# without touching call sites.
+_GRAD_SCALER_FACTORY_MAPPING: Mapping[
+    Tuple[torch.dtype, bool], Callable[[], torch.amp.GradScaler]
+] = {
+    (torch.float16, False): GradScaler,
+    (torch.float16, True): _sharded_grad_scaler_factory,
+}
 
 
 def get_grad_scaler_from_precision(
@@ -51,11 +72,9 @@ def get_grad_scaler_from_precision(
         The appropriate grad scaler to use, ``None`` if no grad scaler should be used.
     """
 
-    if precision == torch.float16:
-        if _is_fsdp_module(module):
-            from torch.distributed.fsdp.sharded_grad_scaler import ShardedGradScaler
-
-            return ShardedGradScaler()
-        else:
-            return GradScaler()
-    return None
+    grad_scaler_factory = _GRAD_SCALER_FACTORY_MAPPING.get(
+        (precision, _is_fsdp_module(module))
+    )
+    if grad_scaler_factory is None:
+        return None
+    return grad_scaler_factory()
@@ -320,6 +320,8 @@ def prepare_module(
         )
 
     if torch_compile_params:
+        # compile must come after the parallelism wrapping above so that
+        # DDP/FSDP hooks are part of the compiled graph
         try:
             # use in-place compile to avoid altering the state_dict keys
             module.compile(**asdict(torch_compile_params))
@@ -327,7 +329,7 @@ def prepare_module(
             rank_zero_warn(
                 "Please install PyTorch nightlies to use in-place compile to avoid altering the state_dict keys when checkpointing."
             )
-            torch.compile(module, **asdict(torch_compile_params))
+            module = torch.compile(module, **asdict(torch_compile_params))
 
     return module
 